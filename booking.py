@@ -4,8 +4,17 @@ Booking Module for Royal Stay Hotel Management System.
 This module defines the Booking class and related functionality.
 """
 
+import logging
 from datetime import datetime, timedelta
-import uuid
+from operator import attrgetter
+from secrets import token_hex
+
+from room import bulk_add_booking
+
+logger = logging.getLogger(__name__)
+
+# Used to sum room prices without a Python-level generator
+_price_per_night = attrgetter('price_per_night')
 
 class Booking:
     """
@@ -14,14 +23,25 @@ class Booking:
     Attributes:
         _booking_id (str): Unique identifier for the booking.
         _guest (Guest): Reference to the guest making the booking.
-        _rooms (list): List of rooms included in the booking.
+        _rooms (dict): Rooms included in the booking, keyed by id(room) in insertion order.
         _check_in_date (datetime): Check-in date and time.
         _check_out_date (datetime): Check-out date and time.
+        _check_in_str (str): Check-in date formatted as YYYY-MM-DD.
+        _check_out_str (str): Check-out date formatted as YYYY-MM-DD.
+        _nights (int): Number of nights between check-in and check-out.
+        _nightly_rate (float): Combined price per night of all rooms in the booking.
         _total_cost (float): Total cost of the booking.
         _is_confirmed (bool): Confirmation status of the booking.
         _is_canceled (bool): Cancellation status of the booking.
+        _canceled_room_count (int): Number of rooms the booking held when it was canceled.
     """
     
+    __slots__ = (
+        '_booking_id', '_guest', '_rooms', '_check_in_date', '_check_out_date',
+        '_check_in_str', '_check_out_str', '_nights', '_nightly_rate', '_total_cost', '_is_confirmed', '_is_canceled',
+        '_canceled_room_count'
+    )
+    
     def __init__(self, guest, check_in_date, check_out_date):
         """
         Initialize a new Booking instance.
@@ -31,14 +51,19 @@ class Booking:
             check_in_date (datetime): Check-in date and time.
             check_out_date (datetime): Check-out date and time.
         """
-        self._booking_id = str(uuid.uuid4())[:8]  # Generate a unique booking ID
+        self._booking_id = token_hex(4)  # Generate a unique booking ID
         self._guest = guest
-        self._rooms = []
+        self._rooms = {}
         self._check_in_date = check_in_date
         self._check_out_date = check_out_date
+        self._check_in_str = check_in_date.strftime('%Y-%m-%d')  # Dates are fixed, so format them once
+        self._check_out_str = check_out_date.strftime('%Y-%m-%d')
+        self._nights = (check_out_date - check_in_date).days
+        self._nightly_rate = 0.0
         self._total_cost = 0.0
         self._is_confirmed = False
         self._is_canceled = False
+        self._canceled_room_count = 0
     
     def add_room(self, room):
         """
@@ -53,19 +78,51 @@ class Booking:
         Raises:
             ValueError: If the room is not available for the booking dates.
         """
-        # Check if the room is available for the booking dates
-        if not room.check_availability(self._check_in_date, self._check_out_date):
-            raise ValueError(f"Room {room.room_number} is not available for the requested dates")
-        
-        # Add booking to the room
+        # Add booking to the room (raises if the dates overlap an existing booking)
         room.add_booking(self._check_in_date, self._check_out_date)
+        self._attach_room(room)
+        return True
+    
+    def add_rooms(self, rooms):
+        """
+        Add several rooms to the booking.
         
-        self._rooms.append(room)
-        self._update_total_cost()
+        The rooms are booked as one step, so no room is added unless every room
+        is distinct and free for the booking dates, even with concurrent bookings.
+        
+        Args:
+            rooms (iterable): The rooms to add to the booking.
+            
+        Returns:
+            bool: True if all rooms were successfully added.
+            
+        Raises:
+            ValueError: If a room is listed more than once or any room is not
+                available for the booking dates.
+        """
+        rooms = list(rooms)  # Read more than once below, so accept any iterable
+        bulk_add_booking(rooms, self._check_in_date, self._check_out_date)
+        
+        for room in rooms:
+            self._attach_room(room)
         
-        print(f"Room {room.room_number} added to booking {self._booking_id}")
         return True
     
+    def _attach_room(self, room):
+        """
+        Record a room that has already been booked for the booking dates.
+        
+        Args:
+            room (Room): The booked room.
+        """
+        self._rooms[id(room)] = room  # By identity: distinct rooms may share a number
+        
+        # Only the new room's price changes the total, so update incrementally
+        self._nightly_rate += room.price_per_night
+        self._total_cost = self._nightly_rate * self._nights
+        
+        logger.info("Room %s added to booking %s", room.room_number, self._booking_id)
+    
     def remove_room(self, room):
         """
         Remove a room from the booking.
@@ -76,24 +133,20 @@ class Booking:
         Returns:
             bool: True if the room was successfully removed.
         """
-        if room in self._rooms:
-            self._rooms.remove(room)
+        if self._rooms.pop(id(room), None) is not None:
             self._update_total_cost()
-            print(f"Room {room.room_number} removed from booking {self._booking_id}")
+            logger.info("Room %s removed from booking %s", room.room_number, self._booking_id)
             return True
         else:
-            print(f"Room {room.room_number} is not part of booking {self._booking_id}")
+            logger.warning("Room %s is not part of booking %s", room.room_number, self._booking_id)
             return False
     
     def _update_total_cost(self):
         """
         Update the total cost of the booking based on rooms and duration.
         """
-        # Calculate the number of nights
-        nights = (self._check_out_date - self._check_in_date).days
-        
-        # Calculate the total cost
-        self._total_cost = sum(room.price_per_night * nights for room in self._rooms)
+        self._nightly_rate = sum(map(_price_per_night, self._rooms.values()))
+        self._total_cost = self._nightly_rate * self._nights
     
     def create_booking(self):
         """
@@ -110,7 +163,7 @@ class Booking:
         # Add the booking to the guest's reservations
         self._guest.add_reservation(self)
         
-        print(f"Booking {self._booking_id} created successfully for {self._guest.name}")
+        logger.info("Booking %s created successfully for %s", self._booking_id, self._guest.name)
         return True
     
     def cancel_booking(self):
@@ -121,13 +174,18 @@ class Booking:
             bool: True if the booking was successfully canceled.
         """
         if self._is_canceled:
-            print(f"Booking {self._booking_id} is already canceled")
+            logger.warning("Booking %s is already canceled", self._booking_id)
             return False
         
         self._is_canceled = True
         self._is_confirmed = False
         
-        print(f"Booking {self._booking_id} has been canceled")
+        # Canceled bookings can stay in a guest's history indefinitely, so drop
+        # the room references and keep only the summary fields for the record
+        self._canceled_room_count = len(self._rooms)
+        self._rooms = {}
+        
+        logger.info("Booking %s has been canceled", self._booking_id)
         return True
     
     def send_confirmation(self):
@@ -141,15 +199,16 @@ class Booking:
             raise ValueError("Cannot send confirmation for an unconfirmed booking")
         
         # In a real system, this would send an email or notification
-        print(f"Confirmation for booking {self._booking_id} sent to {self._guest.email}")
-        
-        # Print booking details
-        print(f"Booking Details:")
-        print(f"Guest: {self._guest.name}")
-        print(f"Check-in: {self._check_in_date.strftime('%Y-%m-%d')}")
-        print(f"Check-out: {self._check_out_date.strftime('%Y-%m-%d')}")
-        print(f"Rooms: {len(self._rooms)}")
-        print(f"Total Cost: ${self._total_cost:.2f}")
+        # Log the confirmation and booking details as a single record
+        logger.info("Confirmation for booking %s sent to %s\n"
+                    "Booking Details:\n"
+                    "Guest: %s\n"
+                    "Check-in: %s\n"
+                    "Check-out: %s\n"
+                    "Rooms: %d\n"
+                    "Total Cost: $%.2f",
+                    self._booking_id, self._guest.email, self._guest.name, self._check_in_str,
+                    self._check_out_str, len(self._rooms), self._total_cost)
         
         return True
     
@@ -160,7 +219,9 @@ class Booking:
         Returns:
             float: Total cost of the booking.
         """
-        self._update_total_cost()
+        # A canceled booking no longer holds its rooms; keep the recorded total
+        if not self._is_canceled:
+            self._update_total_cost()
         return self._total_cost
     
     # Getter methods
@@ -176,8 +237,8 @@ class Booking:
     
     @property
     def rooms(self):
-        """Get the list of rooms."""
-        return self._rooms
+        """Get the rooms as a read-only tuple."""
+        return tuple(self._rooms.values())
     
     @property
     def check_in_date(self):
@@ -189,6 +250,21 @@ class Booking:
         """Get the check-out date."""
         return self._check_out_date
     
+    @property
+    def check_in_str(self):
+        """Get the check-in date formatted as YYYY-MM-DD."""
+        return self._check_in_str
+    
+    @property
+    def check_out_str(self):
+        """Get the check-out date formatted as YYYY-MM-DD."""
+        return self._check_out_str
+    
+    @property
+    def nights(self):
+        """Get the number of nights."""
+        return self._nights
+    
     @property
     def total_cost(self):
         """Get the total cost."""
@@ -212,10 +288,12 @@ class Booking:
             str: String representation of the Booking.
         """
         status = "Confirmed" if self._is_confirmed else "Pending"
+        room_count = len(self._rooms)
         if self._is_canceled:
             status = "Canceled"
+            room_count = self._canceled_room_count
         
         return f"Booking ID: {self._booking_id}, Guest: {self._guest.name}, " \
-               f"Check-in: {self._check_in_date.strftime('%Y-%m-%d')}, " \
-               f"Check-out: {self._check_out_date.strftime('%Y-%m-%d')}, " \
-               f"Rooms: {len(self._rooms)}, Total: ${self._total_cost:.2f}, Status: {status}"
+               f"Check-in: {self._check_in_str}, " \
+               f"Check-out: {self._check_out_str}, " \
+               f"Rooms: {room_count}, Total: ${self._total_cost:.2f}, Status: {status}"
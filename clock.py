@@ -0,0 +1,45 @@
+"""
+Clock Module for Royal Stay Hotel Management System.
+
+This module provides the current time to the other modules, with support for
+reusing a single timestamp across a batch of operations.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Per-thread timestamp set by frozen_time(); None when the clock is live
+_frozen = threading.local()
+
+def now():
+    """
+    Get the current date and time.
+
+    Returns:
+        datetime: The frozen time if inside frozen_time(), otherwise datetime.now().
+    """
+    moment = getattr(_frozen, "moment", None)
+    return moment if moment is not None else datetime.now()
+
+@contextmanager
+def frozen_time(moment=None):
+    """
+    Freeze the clock for the current thread while the block runs.
+
+    Every call to now() inside the block returns the same timestamp, so a batch
+    of operations (e.g. completing many service requests) reads the system clock
+    once instead of once per operation.
+
+    Args:
+        moment (datetime, optional): Time to freeze at. Defaults to datetime.now().
+
+    Yields:
+        datetime: The frozen time.
+    """
+    previous = getattr(_frozen, "moment", None)
+    _frozen.moment = moment if moment is not None else datetime.now()
+    try:
+        yield _frozen.moment
+    finally:
+        _frozen.moment = previous
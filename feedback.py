@@ -4,8 +4,22 @@ Feedback Module for Royal Stay Hotel Management System.
 This module defines the Feedback class and related functionality.
 """
 
-import uuid
-from datetime import datetime
+import logging
+import sys
+from secrets import token_hex
+from enum import IntEnum
+
+import clock
+
+logger = logging.getLogger(__name__)
+
+class FeedbackCategory(IntEnum):
+    """Enumeration of feedback categories, valued by their slot in the category ratings."""
+    CLEANLINESS = 0
+    COMFORT = 1
+    STAFF = 2
+    VALUE = 3
+    LOCATION = 4
 
 class Feedback:
     """
@@ -18,9 +32,21 @@ class Feedback:
         _rating (int): Numerical rating (1-5) given by the guest.
         _comment (str): Detailed comment provided by the guest.
         _submission_date (datetime): Date and time when the feedback was submitted.
-        _categories (dict): Ratings for specific categories.
+        _submission_date_str (str): Submission date formatted as YYYY-MM-DD.
+        _categories (list): Ratings for specific categories, indexed by FeedbackCategory.
     """
     
+    __slots__ = (
+        '_feedback_id', '_guest', '_booking', '_rating', '_comment', '_submission_date',
+        '_submission_date_str', '_categories'
+    )
+    
+    # Category name -> slot in _categories. Names built with lower() are not
+    # interned, so intern them to let lookups with literal names match by identity.
+    _CATEGORY_INDEX = {sys.intern(category.name.lower()): category for category in FeedbackCategory}
+    _NUM_CATEGORIES = len(_CATEGORY_INDEX)
+    _CATEGORIES_ERR = f"Invalid category. Choose from: {', '.join(_CATEGORY_INDEX)}"
+    
     def __init__(self, guest, booking, rating, comment=""):
         """
         Initialize a new Feedback instance.
@@ -31,24 +57,33 @@ class Feedback:
             rating (int): Numerical rating (1-5) given by the guest.
             comment (str, optional): Detailed comment provided by the guest.
         """
-        self._feedback_id = str(uuid.uuid4())[:8]  # Generate a unique feedback ID
+        self._feedback_id = token_hex(4)  # Generate a unique feedback ID
         self._guest = guest
         self._booking = booking
         
         # Validate rating
-        if not isinstance(rating, int) or rating < 1 or rating > 5:
-            raise ValueError("Rating must be an integer between 1 and 5")
+        self._validate_rating(rating)
         
         self._rating = rating
         self._comment = comment
-        self._submission_date = datetime.now()
-        self._categories = {
-            "cleanliness": 0,
-            "comfort": 0,
-            "staff": 0,
-            "value": 0,
-            "location": 0
-        }
+        self._submission_date = clock.now()
+        self._submission_date_str = self._submission_date.strftime('%Y-%m-%d')
+        self._categories = [0] * self._NUM_CATEGORIES
+    
+    @staticmethod
+    def _validate_rating(rating):
+        """
+        Validate a rating value.
+        
+        Args:
+            rating (int): The rating value to validate.
+            
+        Raises:
+            ValueError: If the rating is not an integer between 1 and 5.
+        """
+        # Check the type too: a float such as 4.5 is in range but not a valid rating
+        if not isinstance(rating, int) or not 1 <= rating <= 5:
+            raise ValueError("Rating must be an integer between 1 and 5")
     
     def submit_review(self):
         """
@@ -57,12 +92,12 @@ class Feedback:
         Returns:
             bool: True if the feedback was submitted successfully.
         """
-        print(f"Feedback submitted successfully. Feedback ID: {self._feedback_id}")
-        print(f"Guest: {self._guest.name}")
-        print(f"Booking: {self._booking.booking_id}")
-        print(f"Rating: {self._rating}/5")
-        if self._comment:
-            print(f"Comment: {self._comment}")
+        logger.info("Feedback submitted successfully. Feedback ID: %s\n"
+                    "Guest: %s\n"
+                    "Booking: %s\n"
+                    "Rating: %d/5%s",
+                    self._feedback_id, self._guest.name, self._booking.booking_id, self._rating,
+                    f"\nComment: {self._comment}" if self._comment else "")
         
         return True
     
@@ -80,14 +115,14 @@ class Feedback:
         Raises:
             ValueError: If category is invalid or rating is out of range.
         """
-        if category not in self._categories:
-            raise ValueError(f"Invalid category. Choose from: {', '.join(self._categories.keys())}")
+        index = self._CATEGORY_INDEX.get(category)
+        if index is None:
+            raise ValueError(self._CATEGORIES_ERR)
         
-        if not isinstance(rating, int) or rating < 1 or rating > 5:
-            raise ValueError("Rating must be an integer between 1 and 5")
+        self._validate_rating(rating)
         
-        self._categories[category] = rating
-        print(f"Category '{category}' rated {rating}/5")
+        self._categories[index] = rating
+        logger.info("Category '%s' rated %d/5", category, rating)
         return True
     
     def rate_experience(self, cleanliness, comfort, staff, value, location):
@@ -104,20 +139,21 @@ class Feedback:
         Returns:
             bool: True if all category ratings were updated successfully.
         """
-        self.rate_category("cleanliness", cleanliness)
-        self.rate_category("comfort", comfort)
-        self.rate_category("staff", staff)
-        self.rate_category("value", value)
-        self.rate_category("location", location)
+        # Ratings are given in FeedbackCategory order
+        ratings = (cleanliness, comfort, staff, value, location)
+        for rating in ratings:
+            self._validate_rating(rating)
+        
+        self._categories[:] = ratings
         
         # Calculate average rating based on categories
-        total_rating = sum(self._categories.values())
-        avg_rating = round(total_rating / len(self._categories))
+        total_rating = sum(ratings)
+        avg_rating = round(total_rating / self._NUM_CATEGORIES)
         
         # Update overall rating
         self._rating = avg_rating
         
-        print(f"All categories rated. Overall rating: {self._rating}/5")
+        logger.info("All categories rated. Overall rating: %d/5", self._rating)
         return True
     
     @staticmethod
@@ -134,11 +170,11 @@ class Feedback:
         """
         # In a real system, this would query a database
         if booking_id:
-            print(f"Viewing feedback for booking {booking_id}")
+            logger.info("Viewing feedback for booking %s", booking_id)
         elif guest_id:
-            print(f"Viewing feedback for guest {guest_id}")
+            logger.info("Viewing feedback for guest %s", guest_id)
         else:
-            print("Viewing all feedback")
+            logger.info("Viewing all feedback")
         
         return "Feedback details would be displayed here"
     
@@ -181,7 +217,7 @@ class Feedback:
     @property
     def categories(self):
         """Get the category ratings."""
-        return self._categories
+        return dict(zip(self._CATEGORY_INDEX, self._categories))
     
     def __str__(self):
         """
@@ -190,9 +226,9 @@ class Feedback:
         Returns:
             str: String representation of the Feedback.
         """
-        categories_str = ", ".join([f"{cat}: {rating}/5" for cat, rating in self._categories.items() if rating > 0])
+        categories_str = ", ".join([f"{cat}: {rating}/5" for cat, rating in zip(self._CATEGORY_INDEX, self._categories) if rating > 0])
         categories_info = f", Categories: {categories_str}" if categories_str else ""
         
         return f"Feedback ID: {self._feedback_id}, Guest: {self._guest.name}, " \
                f"Booking: {self._booking.booking_id}, Rating: {self._rating}/5" \
-               f"{categories_info}, Date: {self._submission_date.strftime('%Y-%m-%d')}"
+               f"{categories_info}, Date: {self._submission_date_str}"
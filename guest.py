@@ -4,6 +4,10 @@ Guest Module for Royal Stay Hotel Management System.
 This module defines the Guest class and related functionality.
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 class Guest:
     """
     Represents a hotel guest with personal details and account functionality.
@@ -14,9 +18,11 @@ class Guest:
         _contact (str): Contact information (phone or email).
         _email (str): Email address of the guest.
         _loyalty_program (LoyaltyProgram): Reference to the guest's loyalty program.
-        _reservations (list): List of the guest's reservations.
+        _reservations (dict): The guest's reservations, keyed by booking ID.
     """
     
+    __slots__ = ('_guest_id', '_name', '_contact', '_email', '_loyalty_program', '_reservations')
+    
     def __init__(self, guest_id, name, contact, email):
         """
         Initialize a new Guest instance.
@@ -32,7 +38,7 @@ class Guest:
         self._contact = contact
         self._email = email
         self._loyalty_program = None
-        self._reservations = []
+        self._reservations = {}
     
     def create_account(self):
         """
@@ -41,7 +47,7 @@ class Guest:
         Returns:
             bool: True if account creation was successful, False otherwise.
         """
-        print(f"Account created for {self._name}")
+        logger.info("Account created for %s", self._name)
         # Logic for account creation would go here
         return True
     
@@ -64,7 +70,7 @@ class Guest:
         if email:
             self._email = email
         
-        print(f"Profile updated for {self._name}")
+        logger.info("Profile updated for %s", self._name)
         return True
     
     def view_reservations(self):
@@ -74,14 +80,15 @@ class Guest:
         Returns:
             list: List of reservations.
         """
-        if not self._reservations:
-            print("No reservations found.")
+        reservations = list(self._reservations.values())
+        if not reservations:
+            logger.info("No reservations found.")
         else:
-            print(f"Found {len(self._reservations)} reservations for {self._name}:")
-            for reservation in self._reservations:
-                print(reservation)
+            logger.info("Found %d reservations for %s:", len(reservations), self._name)
+            for reservation in reservations:
+                logger.info("%s", reservation)
         
-        return self._reservations
+        return reservations
     
     def add_reservation(self, reservation):
         """
@@ -93,10 +100,22 @@ class Guest:
         Returns:
             bool: True if the reservation was added successfully.
         """
-        self._reservations.append(reservation)
-        print(f"Reservation {reservation.booking_id} added to {self._name}'s account.")
+        self._reservations[reservation.booking_id] = reservation
+        logger.info("Reservation %s added to %s's account.", reservation.booking_id, self._name)
         return True
     
+    def get_reservation(self, booking_id):
+        """
+        Look up one of the guest's reservations by booking ID.
+        
+        Args:
+            booking_id (str): ID of the booking to look up.
+            
+        Returns:
+            Booking: The matching reservation, or None if not found.
+        """
+        return self._reservations.get(booking_id)
+    
     def set_loyalty_program(self, loyalty_program):
         """
         Associate a loyalty program with the guest.
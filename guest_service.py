@@ -4,10 +4,14 @@ Guest Service Module for Royal Stay Hotel Management System.
 This module defines the GuestService class and related functionality.
 """
 
-import uuid
-from datetime import datetime
+import logging
+from secrets import token_hex
 from enum import Enum
 
+import clock
+
+logger = logging.getLogger(__name__)
+
 class ServiceType(Enum):
     """Enumeration of service types available at the hotel."""
     HOUSEKEEPING = "Housekeeping"
@@ -40,8 +44,15 @@ class GuestService:
         _status (ServiceStatus): Current status of the request.
         _assigned_staff (str): Name of staff assigned to the request.
         _completion_time (datetime): Time when the request was completed.
+        _completion_time_str (str): Completion time formatted as YYYY-MM-DD HH:MM:SS.
     """
     
+    __slots__ = (
+        '_service_id', '_guest', '_room_number', '_service_type', '_description',
+        '_request_time', '_status', '_assigned_staff', '_completion_time',
+        '_completion_time_str'
+    )
+    
     def __init__(self, guest, room_number, service_type, description):
         """
         Initialize a new GuestService instance.
@@ -52,7 +63,7 @@ class GuestService:
             service_type (ServiceType): Type of service requested.
             description (str): Description of the service request.
         """
-        self._service_id = str(uuid.uuid4())[:8]  # Generate a unique service ID
+        self._service_id = token_hex(4)  # Generate a unique service ID
         self._guest = guest
         self._room_number = room_number
         
@@ -61,10 +72,11 @@ class GuestService:
         
         self._service_type = service_type
         self._description = description
-        self._request_time = datetime.now()
+        self._request_time = clock.now()
         self._status = ServiceStatus.REQUESTED
         self._assigned_staff = None
         self._completion_time = None
+        self._completion_time_str = None
     
     def request_service(self):
         """
@@ -73,12 +85,27 @@ class GuestService:
         Returns:
             bool: True if the service request was created successfully.
         """
-        print(f"Service request {self._service_id} created for {self._service_type.value}")
-        print(f"Guest: {self._guest.name}, Room: {self._room_number}")
-        print(f"Description: {self._description}")
+        logger.info("Service request %s created for %s\n"
+                    "Guest: %s, Room: %s\n"
+                    "Description: %s",
+                    self._service_id, self._service_type.value, self._guest.name,
+                    self._room_number, self._description)
         
         return True
     
+    def _mark_completed(self):
+        """
+        Record the completion time of the service request.
+        """
+        self._completion_time = clock.now()
+        self._completion_time_str = self._completion_time.strftime('%Y-%m-%d %H:%M:%S')
+        logger.info("Service request completed at %s", self._completion_time_str)
+    
+    # Side effects to run when a request enters a given status
+    _TRANSITION_HOOKS = {
+        ServiceStatus.COMPLETED: _mark_completed
+    }
+    
     def update_status(self, new_status):
         """
         Update the status of the service request.
@@ -95,11 +122,11 @@ class GuestService:
         old_status = self._status
         self._status = new_status
         
-        print(f"Service request {self._service_id} status updated from {old_status.value} to {new_status.value}")
+        logger.info("Service request %s status updated from %s to %s", self._service_id, old_status.value, new_status.value)
         
-        if new_status == ServiceStatus.COMPLETED:
-            self._completion_time = datetime.now()
-            print(f"Service request completed at {self._completion_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        hook = self._TRANSITION_HOOKS.get(new_status)
+        if hook is not None:
+            hook(self)
         
         return True
     
@@ -116,7 +143,7 @@ class GuestService:
         self._assigned_staff = staff_name
         self.update_status(ServiceStatus.ASSIGNED)
         
-        print(f"Staff member '{staff_name}' assigned to service request {self._service_id}")
+        logger.info("Staff member '%s' assigned to service request %s", staff_name, self._service_id)
         return True
     
     def complete_service(self):
@@ -127,7 +154,7 @@ class GuestService:
             bool: True if the service was marked as completed successfully.
         """
         if self._status == ServiceStatus.COMPLETED:
-            print(f"Service request {self._service_id} is already completed")
+            logger.warning("Service request %s is already completed", self._service_id)
             return False
         
         return self.update_status(ServiceStatus.COMPLETED)
@@ -140,7 +167,7 @@ class GuestService:
             bool: True if the service was canceled successfully.
         """
         if self._status == ServiceStatus.COMPLETED:
-            print(f"Cannot cancel a completed service request")
+            logger.warning("Cannot cancel a completed service request")
             return False
         
         return self.update_status(ServiceStatus.CANCELED)
@@ -199,7 +226,7 @@ class GuestService:
             str: String representation of the GuestService.
         """
         assigned = f"Assigned to: {self._assigned_staff}" if self._assigned_staff else "Not assigned"
-        completion = f"Completed at: {self._completion_time.strftime('%Y-%m-%d %H:%M:%S')}" if self._completion_time else "Not completed"
+        completion = f"Completed at: {self._completion_time_str}" if self._completion_time else "Not completed"
         
         return f"Service ID: {self._service_id}, Type: {self._service_type.value}, " \
                f"Room: {self._room_number}, Status: {self._status.value}, " \
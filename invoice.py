@@ -4,7 +4,19 @@ Invoice Module for Royal Stay Hotel Management System.
 This module defines the Invoice class and related functionality.
 """
 
-from datetime import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from math import fsum
+from typing import NamedTuple
+
+import clock
+
+logger = logging.getLogger(__name__)
+
+class LineItem(NamedTuple):
+    """A single charge on an invoice."""
+    description: str
+    amount: float
 
 class Invoice:
     """
@@ -15,10 +27,17 @@ class Invoice:
         _booking (Booking): Reference to the associated booking.
         _payment (Payment): Reference to the associated payment.
         _issue_date (datetime): Date and time when the invoice was issued.
+        _issue_date_str (str): Issue date formatted as YYYY-MM-DD.
         _due_date (datetime): Due date for the payment.
-        _items (list): List of line items in the invoice.
+        _items (list): List of LineItem entries in the invoice.
+        _total_cache (float): Cached invoice total, or None if it needs recomputing.
     """
     
+    __slots__ = (
+        '_invoice_id', '_booking', '_payment', '_issue_date', '_issue_date_str',
+        '_due_date', '_items', '_total_cache'
+    )
+    
     def __init__(self, invoice_id, booking, payment):
         """
         Initialize a new Invoice instance.
@@ -31,9 +50,11 @@ class Invoice:
         self._invoice_id = invoice_id
         self._booking = booking
         self._payment = payment
-        self._issue_date = datetime.now()
+        self._issue_date = clock.now()
+        self._issue_date_str = self._issue_date.strftime('%Y-%m-%d')
         self._due_date = self._issue_date  # For hotel bookings, payment is typically immediate
         self._items = []
+        self._total_cache = None
         
         # Add line items based on the booking
         self._generate_line_items()
@@ -42,16 +63,17 @@ class Invoice:
         """
         Generate line items based on the booking details.
         """
-        # Calculate number of nights
-        nights = (self._booking.check_out_date - self._booking.check_in_date).days
+        nights = self._booking.nights
+        nights_suffix = f" - {nights} nights"  # Same for every room, so format it once
         
         # Add room charges
-        for room in self._booking.rooms:
-            room_charge = room.price_per_night * nights
-            self._items.append({
-                "description": f"Room {room.room_number} ({room.room_type.value}) - {nights} nights",
-                "amount": room_charge
-            })
+        room_items = [
+            LineItem(f"Room {room.room_number} ({room.room_type_str}){nights_suffix}",
+                     room.price_per_night * nights)
+            for room in self._booking.rooms
+        ]
+        self._items.extend(room_items)
+        self._total_cache = None
     
     def add_item(self, description, amount):
         """
@@ -61,11 +83,25 @@ class Invoice:
             description (str): Description of the item.
             amount (float): Price of the item.
         """
-        self._items.append({
-            "description": description,
-            "amount": amount
-        })
-        print(f"Item '{description}' added to invoice {self._invoice_id}")
+        self._items.append(LineItem(description, amount))
+        self._total_cache = None
+        logger.info("Item '%s' added to invoice %s", description, self._invoice_id)
+    
+    def add_items(self, items):
+        """
+        Add several line items to the invoice in one call.
+        
+        Args:
+            items (iterable): (description, amount) pairs to add.
+            
+        Returns:
+            int: Number of items added.
+        """
+        new_items = [LineItem(description, amount) for description, amount in items]
+        self._items.extend(new_items)
+        self._total_cache = None
+        logger.info("Added %d items to invoice %s", len(new_items), self._invoice_id)
+        return len(new_items)
     
     def calculate_total(self):
         """
@@ -74,7 +110,10 @@ class Invoice:
         Returns:
             float: Total amount.
         """
-        return sum(item["amount"] for item in self._items)
+        if self._total_cache is None:
+            # fsum is exact, so many small charges do not accumulate rounding error
+            self._total_cache = fsum(item.amount for item in self._items)
+        return self._total_cache
     
     def send_invoice(self):
         """
@@ -85,7 +124,7 @@ class Invoice:
         """
         # In a real system, this would send an email or notification
         guest_email = self._booking.guest.email
-        print(f"Invoice {self._invoice_id} sent to {guest_email}")
+        logger.info("Invoice %s sent to %s", self._invoice_id, guest_email)
         
         return True
     
@@ -97,7 +136,7 @@ class Invoice:
             str: Path to the generated PDF file.
         """
         # In a real system, this would generate a PDF file
-        print(f"PDF invoice generated for Invoice {self._invoice_id}")
+        logger.info("PDF invoice generated for Invoice %s", self._invoice_id)
         return f"invoice_{self._invoice_id}.pdf"
     
     # Getter methods
@@ -128,8 +167,8 @@ class Invoice:
     
     @property
     def items(self):
-        """Get the line items."""
-        return self._items
+        """Get the line items as a read-only tuple."""
+        return tuple(self._items)
     
     def __str__(self):
         """
@@ -140,17 +179,54 @@ class Invoice:
         """
         total = self.calculate_total()
         
-        invoice_str = f"Invoice ID: {self._invoice_id}\n"
-        invoice_str += f"Issue Date: {self._issue_date.strftime('%Y-%m-%d')}\n"
-        invoice_str += f"Guest: {self._booking.guest.name}\n"
-        invoice_str += f"Booking ID: {self._booking.booking_id}\n"
-        invoice_str += f"Check-in: {self._booking.check_in_date.strftime('%Y-%m-%d')}\n"
-        invoice_str += f"Check-out: {self._booking.check_out_date.strftime('%Y-%m-%d')}\n"
-        invoice_str += f"\nItems:\n"
+        # Collect the lines and join once instead of growing a string with +=
+        lines = [
+            f"Invoice ID: {self._invoice_id}",
+            f"Issue Date: {self._issue_date_str}",
+            f"Guest: {self._booking.guest.name}",
+            f"Booking ID: {self._booking.booking_id}",
+            # The booking formats its fixed dates once when it is created
+            f"Check-in: {self._booking.check_in_str}",
+            f"Check-out: {self._booking.check_out_str}",
+            "",
+            "Items:"
+        ]
+        lines.extend([f"- {item.description}: ${item.amount:.2f}" for item in self._items])
+        lines.append("")
+        lines.append(f"Total Amount: ${total:.2f}")
         
-        for item in self._items:
-            invoice_str += f"- {item['description']}: ${item['amount']:.2f}\n"
+        return "\n".join(lines)
+
+def generate_pdfs_batch(invoices, max_workers=None):
+    """
+    Generate PDF versions of many invoices concurrently.
+    
+    A thread pool is used because invoices reference rooms holding locks, so
+    they cannot be pickled for a process pool.
+    
+    Args:
+        invoices (list): Invoices to generate PDFs for.
+        max_workers (int, optional): Maximum number of worker threads.
         
-        invoice_str += f"\nTotal Amount: ${total:.2f}"
+    Returns:
+        list: Paths to the generated PDF files, in the order of the invoices.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(Invoice.generate_pdf, invoices))
+
+def send_invoices_batch(invoices, max_workers=None):
+    """
+    Send many invoices to their guests concurrently.
+    
+    Like generate_pdfs_batch, this uses a thread pool because invoices cannot
+    be pickled for a process pool.
+    
+    Args:
+        invoices (list): Invoices to send.
+        max_workers (int, optional): Maximum number of worker threads.
         
-        return invoice_str
+    Returns:
+        list: Send result for each invoice, in the order of the invoices.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(Invoice.send_invoice, invoices))
@@ -4,6 +4,11 @@ Loyalty Program Module for Royal Stay Hotel Management System.
 This module defines the LoyaltyProgram class and related functionality.
 """
 
+import logging
+from bisect import bisect_right
+
+logger = logging.getLogger(__name__)
+
 class LoyaltyProgram:
     """
     Represents a loyalty program for hotel guests.
@@ -23,6 +28,11 @@ class LoyaltyProgram:
         "Platinum": 10000
     }
     
+    # Tier names and their thresholds in ascending order, for bisecting by points
+    _TIER_NAMES, _TIER_CUTOFFS = zip(*sorted(TIER_THRESHOLDS.items(), key=lambda x: x[1]))
+    
+    __slots__ = ('_member_id', '_points', '_tier', '_guest')
+    
     def __init__(self, member_id, guest):
         """
         Initialize a new LoyaltyProgram instance.
@@ -51,7 +61,7 @@ class LoyaltyProgram:
         self._points += points_earned
         self._update_tier()
         
-        print(f"Earned {points_earned} points. New balance: {self._points} points.")
+        logger.info("Earned %d points. New balance: %d points.", points_earned, self._points)
         return points_earned
     
     def redeem_points(self, points_to_redeem):
@@ -75,7 +85,7 @@ class LoyaltyProgram:
         self._points -= points_to_redeem
         self._update_tier()
         
-        print(f"Redeemed {points_to_redeem} points for ${redemption_value:.2f}. Remaining balance: {self._points} points.")
+        logger.info("Redeemed %d points for $%.2f. Remaining balance: %d points.", points_to_redeem, redemption_value, self._points)
         return redemption_value
     
     def check_balance(self):
@@ -85,19 +95,21 @@ class LoyaltyProgram:
         Returns:
             int: Current point balance.
         """
-        print(f"Current point balance: {self._points} points. Tier: {self._tier}")
+        logger.info("Current point balance: %d points. Tier: %s", self._points, self._tier)
         return self._points
     
     def _update_tier(self):
         """
         Update the membership tier based on points.
         """
-        for tier, threshold in sorted(self.TIER_THRESHOLDS.items(), key=lambda x: x[1], reverse=True):
-            if self._points >= threshold:
-                if self._tier != tier:
-                    self._tier = tier
-                    print(f"Congratulations! You have been upgraded to {tier} tier.")
-                break
+        index = bisect_right(self._TIER_CUTOFFS, self._points) - 1
+        if index < 0:
+            return  # Below every threshold (negative balance): keep the current tier
+        
+        tier = self._TIER_NAMES[index]
+        if self._tier != tier:
+            self._tier = tier
+            logger.info("Congratulations! You have been upgraded to %s tier.", tier)
     
     # Getter and setter methods
     @property
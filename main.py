@@ -5,12 +5,13 @@ This module provides a simple demo of the Royal Stay Hotel Management System.
 """
 
 from datetime import datetime, timedelta
+import logging
 import sys
 
 # Import the modules
 from guest import Guest
 from loyalty_program import LoyaltyProgram
-from room import Room, RoomType
+from room import Room, RoomType, find_available_rooms
 from booking import Booking
 from payment import Payment
 from invoice import Invoice
@@ -21,6 +22,9 @@ def main():
     """
     Main function to demonstrate the hotel management system.
     """
+    # Show the system's activity log alongside the demo output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("=" * 80)
     print("Welcome to Royal Stay Hotel Management System".center(80))
     print("=" * 80)
@@ -80,8 +84,7 @@ def main():
     print(f"   Check-in: {check_in_date.strftime('%Y-%m-%d')}")
     print(f"   Check-out: {check_out_date.strftime('%Y-%m-%d')}")
     
-    available_rooms = [room for room in rooms 
-                      if room.check_availability(check_in_date, check_out_date)]
+    available_rooms = list(find_available_rooms(rooms, check_in_date, check_out_date))
     
     print(f"\nFound {len(available_rooms)} available rooms:")
     for room in available_rooms:
@@ -4,8 +4,12 @@ Payment Module for Royal Stay Hotel Management System.
 This module defines the Payment class and related functionality.
 """
 
-import uuid
-from datetime import datetime
+import logging
+from secrets import token_hex
+
+import clock
+
+logger = logging.getLogger(__name__)
 
 class Payment:
     """
@@ -21,7 +25,15 @@ class Payment:
         _payment_details (dict): Additional details about the payment.
     """
     
-    PAYMENT_METHODS = ["Credit Card", "Debit Card", "Cash", "Mobile Wallet", "Bank Transfer"]
+    # Ordered for display; PAYMENT_METHODS gives O(1) membership checks
+    _PAYMENT_METHOD_ORDER = ("Credit Card", "Debit Card", "Cash", "Mobile Wallet", "Bank Transfer")
+    PAYMENT_METHODS = frozenset(_PAYMENT_METHOD_ORDER)
+    _PAYMENT_METHODS_ERR = f"Invalid payment method. Choose from: {', '.join(_PAYMENT_METHOD_ORDER)}"
+    
+    __slots__ = (
+        '_payment_id', '_booking', '_amount', '_payment_method', '_transaction_date',
+        '_is_successful', '_payment_details'
+    )
     
     def __init__(self, booking, amount, payment_method, payment_details=None):
         """
@@ -33,12 +45,12 @@ class Payment:
             payment_method (str): Method of payment.
             payment_details (dict, optional): Additional details about the payment.
         """
-        self._payment_id = str(uuid.uuid4())[:8]  # Generate a unique payment ID
+        self._payment_id = token_hex(4)  # Generate a unique payment ID
         self._booking = booking
         self._amount = amount
         
         if payment_method not in self.PAYMENT_METHODS:
-            raise ValueError(f"Invalid payment method. Choose from: {', '.join(self.PAYMENT_METHODS)}")
+            raise ValueError(self._PAYMENT_METHODS_ERR)
         
         self._payment_method = payment_method
         self._transaction_date = None
@@ -53,13 +65,13 @@ class Payment:
             bool: True if the payment was successful, False otherwise.
         """
         # In a real system, this would integrate with a payment gateway
-        print(f"Processing payment of ${self._amount:.2f} via {self._payment_method}")
+        logger.info("Processing payment of $%.2f via %s", self._amount, self._payment_method)
         
         # Simulate payment processing
         self._is_successful = True
-        self._transaction_date = datetime.now()
+        self._transaction_date = clock.now()
         
-        print(f"Payment successful! Payment ID: {self._payment_id}")
+        logger.info("Payment successful! Payment ID: %s", self._payment_id)
         return True
     
     def generate_invoice(self):
@@ -75,7 +87,7 @@ class Payment:
             raise ValueError("Cannot generate invoice for an unsuccessful payment")
         
         invoice = Invoice(self._payment_id, self._booking, self)
-        print(f"Invoice generated for payment {self._payment_id}")
+        logger.info("Invoice generated for payment %s", self._payment_id)
         return invoice
     
     def apply_discount(self, discount_amount):
@@ -95,7 +107,7 @@ class Payment:
             raise ValueError("Discount amount cannot exceed payment amount")
         
         self._amount -= discount_amount
-        print(f"Discount of ${discount_amount:.2f} applied. New amount: ${self._amount:.2f}")
+        logger.info("Discount of $%.2f applied. New amount: $%.2f", discount_amount, self._amount)
         return self._amount
     
     # Getter and setter methods
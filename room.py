@@ -4,8 +4,14 @@ Room Module for Royal Stay Hotel Management System.
 This module defines the Room class, RoomType enumeration, and related functionality.
 """
 
+import logging
+import threading
+from bisect import bisect_left, bisect_right
 from enum import Enum
 from datetime import datetime
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
 
 class RoomType(Enum):
     """Enumeration of room types available at the hotel."""
@@ -14,6 +20,14 @@ class RoomType(Enum):
     SUITE = "Suite"
     DELUXE = "Deluxe Room"
 
+class RoomDetails(NamedTuple):
+    """Read-only snapshot of a room's details."""
+    room_number: int
+    room_type: str
+    amenities: tuple
+    price_per_night: float
+    is_available: bool
+
 class Room:
     """
     Represents a hotel room with its properties and functionality.
@@ -21,12 +35,20 @@ class Room:
     Attributes:
         _room_number (int): Unique room number.
         _room_type (RoomType): Type of room.
+        _room_type_str (str): Display name of the room type.
         _amenities (list): List of amenities available in the room.
         _price_per_night (float): Cost per night.
         _is_available (bool): Availability status.
-        _bookings (list): List of booking periods for the room.
+        _booking_starts (list): Check-in dates of the room's bookings, sorted.
+        _booking_ends (list): Check-out dates of the same bookings, in the same order.
+        _bookings_lock (threading.Lock): Serializes availability checks and inserts on the booking lists.
     """
     
+    __slots__ = (
+        '_room_number', '_room_type', '_room_type_str', '_amenities', '_price_per_night',
+        '_is_available', '_booking_starts', '_booking_ends', '_bookings_lock'
+    )
+    
     def __init__(self, room_number, room_type, amenities, price_per_night):
         """
         Initialize a new Room instance.
@@ -39,10 +61,17 @@ class Room:
         """
         self._room_number = room_number
         self._room_type = room_type
+        self._room_type_str = room_type.value  # Enum .value goes through a descriptor; cache it
         self._amenities = amenities
         self._price_per_night = price_per_night
         self._is_available = True
-        self._bookings = []  # List of (check_in, check_out) tuples
+        # Non-overlapping booking periods as parallel columns rather than
+        # (check_in, check_out) tuples, so no tuple is allocated per booking
+        self._booking_starts = []
+        self._booking_ends = []
+        # One lock per room: both lists are shared and every insert shifts them,
+        # so even bookings for disjoint dates must not interleave
+        self._bookings_lock = threading.Lock()
     
     def check_availability(self, check_in_date, check_out_date):
         """
@@ -58,10 +87,38 @@ class Room:
         if check_in_date >= check_out_date:
             raise ValueError("Check-in date must be before check-out date")
         
-        for booking_check_in, booking_check_out in self._bookings:
-            # Check if there's an overlap with existing bookings
-            if (check_in_date < booking_check_out and check_out_date > booking_check_in):
-                return False
+        return self._is_free(check_in_date, check_out_date)
+    
+    def _is_free(self, check_in_date, check_out_date):
+        """
+        Check already-validated dates against the room's bookings.
+        
+        Args:
+            check_in_date (datetime): Check-in date.
+            check_out_date (datetime): Check-out date, after check_in_date.
+            
+        Returns:
+            bool: True if no booking overlaps the dates, False otherwise.
+        """
+        with self._bookings_lock:
+            return self._is_free_locked(check_in_date, check_out_date)
+    
+    def _is_free_locked(self, check_in_date, check_out_date):
+        """
+        Check already-validated dates against the bookings; _bookings_lock must be held.
+        
+        Args:
+            check_in_date (datetime): Check-in date.
+            check_out_date (datetime): Check-out date, after check_in_date.
+            
+        Returns:
+            bool: True if no booking overlaps the dates, False otherwise.
+        """
+        # Bookings never overlap, so the last booking starting before the
+        # requested check-out also ends last; it is the only one to compare.
+        index = bisect_left(self._booking_starts, check_out_date)
+        if index and self._booking_ends[index - 1] > check_in_date:
+            return False
         
         return True
     
@@ -79,13 +136,32 @@ class Room:
         Raises:
             ValueError: If the room is not available for the requested dates.
         """
-        if not self.check_availability(check_in_date, check_out_date):
-            raise ValueError(f"Room {self._room_number} is not available for the requested dates")
+        if check_in_date >= check_out_date:
+            raise ValueError("Check-in date must be before check-out date")
         
-        self._bookings.append((check_in_date, check_out_date))
-        print(f"Booking added for Room {self._room_number} from {check_in_date.date()} to {check_out_date.date()}")
+        # Check and insert under the room's lock, so no other booking can slip in
+        # between the availability check and the inserts
+        with self._bookings_lock:
+            if not self._is_free_locked(check_in_date, check_out_date):
+                raise ValueError(f"Room {self._room_number} is not available for the requested dates")
+            
+            self._insert_booking_locked(check_in_date, check_out_date)
+        
+        logger.info("Booking added for Room %s from %s to %s", self._room_number, check_in_date.date(), check_out_date.date())
         return True
     
+    def _insert_booking_locked(self, check_in_date, check_out_date):
+        """
+        Insert free, already-validated dates into the bookings; _bookings_lock must be held.
+        
+        Args:
+            check_in_date (datetime): Check-in date.
+            check_out_date (datetime): Check-out date, after check_in_date.
+        """
+        index = bisect_right(self._booking_starts, check_in_date)
+        self._booking_starts.insert(index, check_in_date)
+        self._booking_ends.insert(index, check_out_date)
+    
     def update_status(self, is_available):
         """
         Update the availability status of the room.
@@ -94,24 +170,17 @@ class Room:
             is_available (bool): New availability status.
         """
         self._is_available = is_available
-        status = "available" if is_available else "unavailable"
-        print(f"Room {self._room_number} is now {status}")
+        logger.info("Room %s is now %s", self._room_number, "available" if is_available else "unavailable")
     
     def get_details(self):
         """
         Get detailed information about the room.
         
         Returns:
-            dict: Dictionary containing room details.
+            RoomDetails: Snapshot of the room details; use _asdict() for a dictionary.
         """
-        details = {
-            "room_number": self._room_number,
-            "room_type": self._room_type.value,
-            "amenities": self._amenities,
-            "price_per_night": self._price_per_night,
-            "is_available": self._is_available
-        }
-        return details
+        return RoomDetails(self._room_number, self._room_type_str, tuple(self._amenities),
+                           self._price_per_night, self._is_available)
     
     # Getter and setter methods
     @property
@@ -124,6 +193,11 @@ class Room:
         """Get the room type."""
         return self._room_type
     
+    @property
+    def room_type_str(self):
+        """Get the display name of the room type."""
+        return self._room_type_str
+    
     @property
     def amenities(self):
         """Get the room amenities."""
@@ -160,5 +234,97 @@ class Room:
         """
         amenities_str = ", ".join(self._amenities)
         status = "Available" if self._is_available else "Not Available"
-        return f"Room {self._room_number} ({self._room_type.value}) - ${self._price_per_night:.2f} per night - " \
-               f"Amenities: {amenities_str} - Status: {status}"
\ No newline at end of file
+        return f"Room {self._room_number} ({self._room_type_str}) - ${self._price_per_night:.2f} per night - " \
+               f"Amenities: {amenities_str} - Status: {status}"
+
+def bulk_check_availability(rooms, check_in_date, check_out_date):
+    """
+    Check the availability of many rooms for the same dates in one pass.
+    
+    The dates are validated once for the whole batch rather than once per room.
+    
+    Args:
+        rooms (list): Rooms to check.
+        check_in_date (datetime): Check-in date.
+        check_out_date (datetime): Check-out date.
+        
+    Returns:
+        list: One bool per room, True if that room is available.
+    """
+    if check_in_date >= check_out_date:
+        raise ValueError("Check-in date must be before check-out date")
+    
+    return [room._is_free(check_in_date, check_out_date) for room in rooms]
+
+def find_available_rooms(rooms, check_in_date, check_out_date):
+    """
+    Find the rooms that are available for the given dates.
+    
+    The dates are validated immediately, but rooms are checked lazily, so a
+    caller that only needs the first few matches stops as soon as it has them.
+    
+    Args:
+        rooms (iterable): Rooms to search.
+        check_in_date (datetime): Check-in date.
+        check_out_date (datetime): Check-out date.
+        
+    Returns:
+        iterator: The available rooms, in the order given.
+    """
+    if check_in_date >= check_out_date:
+        raise ValueError("Check-in date must be before check-out date")
+    
+    return (room for room in rooms if room._is_free(check_in_date, check_out_date))
+
+def bulk_add_booking(rooms, check_in_date, check_out_date):
+    """
+    Book many rooms for the same dates as one all-or-nothing step.
+    
+    Every room's lock is held from the availability check through the inserts,
+    so no concurrent booking can take one of the rooms in between: either all
+    rooms are booked or none is.
+    
+    Args:
+        rooms (list): Distinct rooms to book.
+        check_in_date (datetime): Check-in date.
+        check_out_date (datetime): Check-out date.
+        
+    Returns:
+        bool: True if all rooms were booked.
+        
+    Raises:
+        ValueError: If a room is listed more than once or any room is not
+            available for the requested dates.
+    """
+    if check_in_date >= check_out_date:
+        raise ValueError("Check-in date must be before check-out date")
+    
+    # A repeated room would be booked twice, and would deadlock on its own lock
+    seen = set()
+    duplicates = []
+    for room in rooms:
+        if id(room) in seen:
+            duplicates.append(str(room._room_number))
+        seen.add(id(room))
+    if duplicates:
+        raise ValueError(f"Rooms {', '.join(duplicates)} are listed more than once")
+    
+    # Take the locks in a stable order so two overlapping batches cannot deadlock
+    locked = sorted(rooms, key=id)
+    for room in locked:
+        room._bookings_lock.acquire()
+    try:
+        unavailable = [str(room._room_number) for room in rooms
+                       if not room._is_free_locked(check_in_date, check_out_date)]
+        if unavailable:
+            raise ValueError(f"Rooms {', '.join(unavailable)} are not available for the requested dates")
+        
+        for room in rooms:
+            room._insert_booking_locked(check_in_date, check_out_date)
+    finally:
+        for room in locked:
+            room._bookings_lock.release()
+    
+    for room in rooms:
+        logger.info("Booking added for Room %s from %s to %s", room._room_number, check_in_date.date(), check_out_date.date())
+    return True
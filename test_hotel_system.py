@@ -2,64 +2,121 @@
 Test Module for Royal Stay Hotel Management System.
 
 This module tests all the components of the hotel management system.
+
+The tests use unittest assertions only, so pytest's assertion rewriting buys
+nothing here; PYTEST_DONT_REWRITE opts this module out of it.
+
+Run with "python -m unittest test_hotel_system". The system is pure Python
+with no C-extension dependencies, so the same command works under PyPy
+("pypy3 -m unittest test_hotel_system"), whose JIT suits this attribute- and
+method-call-heavy code, particularly the large room search test.
 """
 
 import sys
+import threading
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import unittest
+from unittest.mock import MagicMock, patch
 
 # Import the modules
 from guest import Guest
 from loyalty_program import LoyaltyProgram
-from room import Room, RoomType
+from room import Room, RoomType, bulk_check_availability, find_available_rooms
 from booking import Booking
 from payment import Payment
-from invoice import Invoice
+from invoice import generate_pdfs_batch, send_invoices_batch
 from guest_service import GuestService, ServiceType
 from feedback import Feedback
+from clock import frozen_time
+
+# Fixed "current" time for the whole suite, so dates and timestamps are the
+# same on every run
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+# Expected totals for the fixed prices and stays used below
+EXPECTED_DOUBLE_SUITE_5N = 2000.0  # 5 nights * (room2 + room3)
+EXPECTED_DOUBLE_3N_WITH_EXTRAS = 575.0  # 3 nights * room2 + $50 late checkout + $75 dinner
+EXPECTED_DOUBLE_3N_WITH_ALL_EXTRAS = 607.5  # the above + $12.50 minibar + $20 parking
+
+# Card details shared by the payment tests; read-only so no test can alter them for another
+_CARD_1234 = MappingProxyType({"card_number": "XXXX-XXXX-XXXX-1234", "expiry": "12/25"})
+_CARD_5678 = MappingProxyType({"card_number": "XXXX-XXXX-XXXX-5678", "expiry": "10/26"})
+
+# (room number, type, amenities, price per night) for room1, room2 and room3
+ROOM_SPECS = (
+    (101, RoomType.SINGLE, ("Wi-Fi", "TV", "Air Conditioning"), 100.0),
+    (201, RoomType.DOUBLE, ("Wi-Fi", "TV", "Mini-bar", "Air Conditioning"), 150.0),
+    (301, RoomType.SUITE, ("Wi-Fi", "TV", "Mini-bar", "Air Conditioning", "Jacuzzi"), 250.0),
+)
 
 class TestHotelSystem(unittest.TestCase):
     """
     Test cases for the Royal Stay Hotel Management System.
     """
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test."""
+        # Freeze the clock the domain classes read for their timestamps
+        clock_freeze = frozen_time(FROZEN_NOW)
+        clock_freeze.__enter__()
+        cls.addClassCleanup(clock_freeze.__exit__, None, None, None)
+        
+        # Dates are immutable, so compute them once for the whole class
+        cls.today = FROZEN_NOW
+        cls.check_in_date = cls.today + timedelta(days=5)
+        cls.check_out_date = cls.today + timedelta(days=8)
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create guests
-        self.guest1 = Guest(1, "John Smith", "+1-555-123-4567", "john.smith@email.com")
-        self.guest2 = Guest(2, "Jane Doe", "+1-555-987-6543", "jane.doe@email.com")
-        
-        # Create loyalty programs
-        self.loyalty1 = LoyaltyProgram(101, self.guest1)
-        self.guest1.set_loyalty_program(self.loyalty1)
-        
-        self.loyalty2 = LoyaltyProgram(102, self.guest2)
-        self.guest2.set_loyalty_program(self.loyalty2)
-        
-        # Create rooms
-        self.room1 = Room(101, RoomType.SINGLE, ["Wi-Fi", "TV", "Air Conditioning"], 100.0)
-        self.room2 = Room(201, RoomType.DOUBLE, ["Wi-Fi", "TV", "Mini-bar", "Air Conditioning"], 150.0)
-        self.room3 = Room(301, RoomType.SUITE, ["Wi-Fi", "TV", "Mini-bar", "Air Conditioning", "Jacuzzi"], 250.0)
-        
-        # Set dates
-        self.today = datetime.now()
-        self.check_in_date = self.today + timedelta(days=5)
-        self.check_out_date = self.today + timedelta(days=8)
+        # Create guests. Most tests only need something guest-shaped to hang a
+        # booking on, so use spec'd mocks; tests of Guest itself build real ones.
+        # MagicMock reserves the name keyword, so set it after construction.
+        self.guest1 = MagicMock(spec=Guest, guest_id=1, contact="+1-555-123-4567", email="john.smith@email.com")
+        self.guest1.name = "John Smith"
+        self.guest2 = MagicMock(spec=Guest, guest_id=2, contact="+1-555-987-6543", email="jane.doe@email.com")
+        self.guest2.name = "Jane Doe"
+        
+        # Create rooms. These stay real: the booking tests exercise the room's
+        # availability search and locking, which a mock would only echo back.
+        # They stay per-test too, since nearly every test books them and a
+        # booking left behind would make the same dates unavailable to the next.
+        # Room keeps its amenities as a mutable list, so each room gets its own copy.
+        self.room1, self.room2, self.room3 = (
+            Room(number, room_type, list(amenities), price)
+            for number, room_type, amenities, price in ROOM_SPECS
+        )
+    
+    def _make_booking(self, guest, room, check_in_date, check_out_date):
+        """Create and confirm a single-room booking."""
+        booking = Booking(guest, check_in_date, check_out_date)
+        booking.add_room(room)
+        booking.create_booking()
+        return booking
+    
+    def _attach_loyalty(self, guest, member_id):
+        """Create a real loyalty program and attach it to a guest."""
+        loyalty_program = LoyaltyProgram(member_id, guest)
+        guest.set_loyalty_program(loyalty_program)
+        return loyalty_program
+    
+    def _confirmed_booking(self, guest, room, check_in_date, check_out_date):
+        """Create a stand-in for a confirmed single-room booking, for tests that only read it."""
+        nights = (check_out_date - check_in_date).days
+        return MagicMock(spec=Booking, booking_id=f"B{room.room_number}", guest=guest, rooms=(room,),
+                         check_in_date=check_in_date, check_out_date=check_out_date,
+                         total_cost=room.price_per_night * nights, is_confirmed=True, is_canceled=False)
     
     def test_guest_account_creation(self):
         """Test the process of guest account creation."""
-        print("\n=== Test: Guest Account Creation ===")
-        
         # Test case 1: Create a new guest account
-        print("Test Case 1: Create a new guest account")
         guest3 = Guest(3, "Bob Johnson", "+1-555-111-2222", "bob.johnson@email.com")
         self.assertTrue(guest3.create_account())
-        print(guest3)
         
         # Test case 2: Update guest profile
-        print("\nTest Case 2: Update guest profile")
         self.assertTrue(guest3.update_profile(contact="+1-555-333-4444", email="bob.j@email.com"))
-        print(guest3)
+        self.assertIn("Contact: +1-555-333-4444, Email: bob.j@email.com", str(guest3))
         
         # Assertions
         self.assertEqual(guest3.name, "Bob Johnson")
@@ -68,52 +125,71 @@ class TestHotelSystem(unittest.TestCase):
     
     def test_searching_available_rooms(self):
         """Test the functionality to search for available rooms."""
-        print("\n=== Test: Searching for Available Rooms ===")
+        # Add a booking to room2, then check every room's availability once
+        self.room2.add_booking(self.check_in_date, self.check_out_date)
+        all_rooms = [self.room1, self.room2, self.room3]
+        availability = bulk_check_availability(all_rooms, self.check_in_date, self.check_out_date)
         
         # Test case 1: Check availability when room is free
-        print("Test Case 1: Check availability when room is free")
-        availability1 = self.room1.check_availability(self.check_in_date, self.check_out_date)
-        self.assertTrue(availability1)
-        print(f"Room {self.room1.room_number} is available: {availability1}")
-        
-        # Add a booking to room2
-        self.room2.add_booking(self.check_in_date, self.check_out_date)
+        self.assertTrue(availability[0])
+        self.assertEqual(self.room1.get_details().room_type, "Single Room")
         
         # Test case 2: Check availability when room is booked
-        print("\nTest Case 2: Check availability when room is booked")
-        availability2 = self.room2.check_availability(self.check_in_date, self.check_out_date)
-        self.assertFalse(availability2)
-        print(f"Room {self.room2.room_number} is available: {availability2}")
+        self.assertFalse(availability[1])
         
         # Test case 3: Filter available rooms based on criteria
-        print("\nTest Case 3: Filter available rooms based on criteria")
-        all_rooms = [self.room1, self.room2, self.room3]
-        available_rooms = [room for room in all_rooms 
-                          if room.check_availability(self.check_in_date, self.check_out_date) 
-                          and room.price_per_night <= 200.0]
-        
-        print("Available rooms under $200:")
-        for room in available_rooms:
-            print(room)
+        available_rooms = [room for room, is_free in zip(all_rooms, availability)
+                           if is_free and room.price_per_night <= 200.0]
         
         self.assertEqual(len(available_rooms), 1)
         self.assertEqual(available_rooms[0].room_number, self.room1.room_number)
+        
+        first_free = next(find_available_rooms(all_rooms, self.check_in_date, self.check_out_date))
+        self.assertIs(first_free, self.room1)
+        with self.assertRaises(ValueError):
+            find_available_rooms(all_rooms, self.check_out_date, self.check_in_date)
+        
+        # Test case 4: Back-to-back stays around an existing booking
+        self.assertTrue(self.room2.check_availability(self.check_out_date, self.check_out_date + timedelta(days=2)))
+        self.assertTrue(self.room2.check_availability(self.check_in_date - timedelta(days=2), self.check_in_date))
+        self.assertFalse(self.room2.check_availability(self.check_in_date + timedelta(days=1), self.check_in_date + timedelta(days=2)))
+        self.assertFalse(self.room2.check_availability(self.check_in_date - timedelta(days=1), self.check_out_date + timedelta(days=1)))
+        
+        self.room2.add_booking(self.check_out_date + timedelta(days=3), self.check_out_date + timedelta(days=5))
+        self.room2.add_booking(self.check_in_date - timedelta(days=3), self.check_in_date - timedelta(days=1))
+        self.assertTrue(self.room2.check_availability(self.check_out_date, self.check_out_date + timedelta(days=3)))
+        self.assertFalse(self.room2.check_availability(self.check_out_date + timedelta(days=4), self.check_out_date + timedelta(days=6)))
+    
+    def test_searching_available_rooms_large(self):
+        """Test searching a large room inventory by price and availability."""
+        room_types = tuple(RoomType)
+        rooms = [Room(1000 + i, room_types[i % len(room_types)], [], 50.0 + (i % 40) * 10.0)
+                 for i in range(10_000)]
+        for room in rooms[::3]:
+            room.add_booking(self.check_in_date, self.check_out_date)
+        
+        # Price is a plain attribute read, so filter on it first and only
+        # search the bookings of the rooms that pass
+        affordable = [room for room in rooms if room.price_per_night <= 200.0]
+        availability = bulk_check_availability(affordable, self.check_in_date, self.check_out_date)
+        available_rooms = [room for room, is_free in zip(affordable, availability) if is_free]
+        
+        expected = [room for room in rooms
+                    if room.check_availability(self.check_in_date, self.check_out_date)
+                    and room.price_per_night <= 200.0]
+        self.assertEqual(available_rooms, expected)
+        self.assertEqual(len(available_rooms), sum(1 for i in range(10_000) if i % 40 <= 15 and i % 3))
     
     def test_making_room_reservation(self):
         """Test the process of making a room reservation."""
-        print("\n=== Test: Making a Room Reservation ===")
-        
         # Test case 1: Create a booking with a single room
-        print("Test Case 1: Create a booking with a single room")
-        booking1 = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking1.add_room(self.room1)
-        booking1.create_booking()
+        booking1 = self._make_booking(self.guest1, self.room1, self.check_in_date, self.check_out_date)
         
         self.assertEqual(len(booking1.rooms), 1)
         self.assertEqual(booking1.guest.name, "John Smith")
+        self.assertTrue(booking1.send_confirmation())
         
         # Test case 2: Create a booking with multiple rooms
-        print("\nTest Case 2: Create a booking with multiple rooms")
         check_in_date2 = self.today + timedelta(days=15)
         check_out_date2 = self.today + timedelta(days=20)
         
@@ -123,56 +199,198 @@ class TestHotelSystem(unittest.TestCase):
         booking2.create_booking()
         
         self.assertEqual(len(booking2.rooms), 2)
-        self.assertEqual(booking2.total_cost, 5 * (150.0 + 250.0))  # 5 nights * (room2 + room3)
-        
-        print(booking2)
+        self.assertAlmostEqual(booking2.total_cost, EXPECTED_DOUBLE_SUITE_5N, places=2)
+        self.assertIn("Rooms: 2, Total: $2000.00, Status: Confirmed", str(booking2))
+        
+        # Test case 3: Add several rooms at once when one is already booked
+        booking3 = Booking(self.guest1, check_in_date2, check_out_date2)
+        with self.assertRaises(ValueError):
+            booking3.add_rooms([self.room1, self.room2])
+        self.assertEqual(len(booking3.rooms), 0)
+        self.assertTrue(self.room1.check_availability(check_in_date2, check_out_date2))
+        
+        # Test case 4: A room listed twice is rejected before anything is booked
+        with self.assertRaises(ValueError):
+            booking3.add_rooms([self.room1, self.room1])
+        self.assertEqual(len(booking3.rooms), 0)
+        self.assertTrue(self.room1.check_availability(check_in_date2, check_out_date2))
+        
+        # Test case 5: Rooms can be passed as any iterable, such as a generator
+        check_in_date4 = self.today + timedelta(days=40)
+        check_out_date4 = self.today + timedelta(days=42)
+        booking4 = Booking(self.guest2, check_in_date4, check_out_date4)
+        self.assertTrue(booking4.add_rooms(room for room in (self.room2, self.room3)))
+        self.assertEqual(booking4.rooms, (self.room2, self.room3))
+        self.assertFalse(self.room3.check_availability(check_in_date4, check_out_date4))
+        
+        # Test case 6: Distinct rooms that share a number are both kept
+        twin_room = Room(101, RoomType.DOUBLE, [], 150.0)
+        booking3.add_room(self.room1)
+        booking3.add_room(twin_room)
+        self.assertEqual(booking3.rooms, (self.room1, twin_room))
+        self.assertEqual(booking3.calculate_total(), booking3.total_cost)
+        self.assertTrue(booking3.remove_room(twin_room))
+        self.assertEqual(booking3.rooms, (self.room1,))
+    
+    def test_concurrent_room_booking(self):
+        """Test that concurrent bookings cannot double-book a room."""
+        # Test case 1: Several threads race for the same dates
+        results = []
+        
+        def book():
+            try:
+                results.append(self.room1.add_booking(self.check_in_date, self.check_out_date))
+            except ValueError:
+                results.append(False)
+        
+        threads = [threading.Thread(target=book) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results.count(True), 1)
+        
+        # Test case 2: Disjoint dates on the same room both succeed
+        check_in_date2 = self.today + timedelta(days=15)
+        check_out_date2 = self.today + timedelta(days=20)
+        self.assertTrue(self.room1.add_booking(check_in_date2, check_out_date2))
+        self.assertFalse(self.room1.check_availability(check_in_date2, check_out_date2))
+        
+        # Test case 3: Many threads book disjoint dates on the same room at once
+        # A tiny switch interval makes the threads interleave inside add_booking
+        stay_starts = [self.today + timedelta(days=30 + day) for day in range(200)]
+        errors = []
+        
+        def book_stays(starts):
+            for check_in in starts:
+                try:
+                    self.room2.add_booking(check_in, check_in + timedelta(days=1))
+                except ValueError as error:
+                    errors.append(error)
+        
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=book_stays, args=(stay_starts[i::8],)) for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(self.room2._booking_starts, stay_starts)
+        self.assertEqual(len(self.room2._booking_ends), len(self.room2._booking_starts))
+        self.assertEqual(self.room2._booking_ends, [check_in + timedelta(days=1) for check_in in stay_starts])
+        
+        # Test case 4: Multi-room bookings racing for the same dates are all-or-nothing
+        # Half the threads list the rooms in reverse, so lock ordering is exercised too
+        check_in_date3 = self.today + timedelta(days=300)
+        check_out_date3 = self.today + timedelta(days=302)
+        bookings = [Booking(self.guest1, check_in_date3, check_out_date3) for _ in range(8)]
+        room_orders = ([self.room1, self.room3], [self.room3, self.room1])
+        outcomes = []
+        start_together = threading.Barrier(len(bookings))
+        
+        def book_rooms(booking, rooms):
+            start_together.wait()
+            try:
+                outcomes.append(booking.add_rooms(rooms))
+            except ValueError:
+                outcomes.append(False)
+        
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=book_rooms, args=(booking, room_orders[i % 2]))
+                       for i, booking in enumerate(bookings)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        self.assertEqual(outcomes.count(True), 1)
+        self.assertEqual(sorted(len(booking.rooms) for booking in bookings), [0] * 7 + [2])
+        self.assertEqual(self.room1._booking_starts.count(check_in_date3), 1)
+        self.assertEqual(self.room3._booking_starts.count(check_in_date3), 1)
+        
+        # Test case 5: A booking that lands while add_rooms runs cannot leave it half-done
+        # The room logger hook books room3 from another thread once room1 is booked
+        check_in_date4 = self.today + timedelta(days=310)
+        check_out_date4 = self.today + timedelta(days=312)
+        booking = Booking(self.guest1, check_in_date4, check_out_date4)
+        intruded = []
+        
+        def intrude(*args):
+            if intruded:
+                return
+            intruded.append(True)
+            
+            def book_room3():
+                try:
+                    self.room3.add_booking(check_in_date4, check_out_date4)
+                except ValueError:
+                    pass
+            
+            thread = threading.Thread(target=book_room3)
+            thread.start()
+            thread.join(timeout=1)
+        
+        with patch("room.logger") as room_logger:
+            room_logger.info.side_effect = intrude
+            try:
+                added = booking.add_rooms([self.room1, self.room3])
+            except ValueError:
+                added = False
+        
+        self.assertEqual(intruded, [True])
+        if added:
+            self.assertEqual(booking.rooms, (self.room1, self.room3))
+            self.assertEqual(self.room3._booking_starts.count(check_in_date4), 1)
+        else:
+            self.assertEqual(booking.rooms, ())
+            self.assertTrue(self.room1.check_availability(check_in_date4, check_out_date4))
     
     def test_booking_confirmation_notification(self):
         """Test the booking confirmation notification system."""
-        print("\n=== Test: Booking Confirmation Notification ===")
-        
         # Test case 1: Send confirmation for a new booking
-        print("Test Case 1: Send confirmation for a new booking")
-        booking = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking.add_room(self.room3)
-        booking.create_booking()
-        self.assertTrue(booking.send_confirmation())
+        # The booking logger stands in for the email, so check what it is handed
+        booking = self._make_booking(self.guest1, self.room3, self.check_in_date, self.check_out_date)
+        with patch("booking.logger") as booking_logger:
+            self.assertTrue(booking.send_confirmation())
+        
+        booking_logger.info.assert_called_once()
+        self.assertEqual(booking_logger.info.call_args.args[1:],
+                         (booking.booking_id, "john.smith@email.com", "John Smith",
+                          self.check_in_date.strftime('%Y-%m-%d'), self.check_out_date.strftime('%Y-%m-%d'),
+                          1, 750.0))
         
         # Test case 2: Attempt to send confirmation for an unconfirmed booking
-        print("\nTest Case 2: Attempt to send confirmation for an unconfirmed booking")
         booking2 = Booking(self.guest2, self.check_in_date, self.check_out_date)
         booking2.add_room(self.room1)
         
-        try:
+        with patch("booking.logger") as booking_logger, self.assertRaises(ValueError):
             booking2.send_confirmation()
-            self.fail("Expected ValueError not raised")
-        except ValueError as e:
-            print(f"Caught expected exception: {e}")
+        booking_logger.info.assert_not_called()
     
     def test_invoice_generation(self):
         """Test the generation of invoices for bookings."""
-        print("\n=== Test: Invoice Generation for a Booking ===")
-        
         # Test case 1: Generate invoice for a simple booking
-        print("Test Case 1: Generate invoice for a simple booking")
-        booking = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking.add_room(self.room1)
-        booking.create_booking()
+        booking = self._make_booking(self.guest1, self.room1, self.check_in_date, self.check_out_date)
         
-        payment = Payment(booking, booking.total_cost, "Credit Card", 
-                         {"card_number": "XXXX-XXXX-XXXX-1234", "expiry": "12/25"})
-        payment.process_payment()
+        payment = Payment(booking, booking.total_cost, "Credit Card", _CARD_1234)
+        self.assertTrue(payment.process_payment())
+        self.assertEqual(payment.transaction_date, FROZEN_NOW)
         
         invoice = payment.generate_invoice()
-        print(invoice)
         
         self.assertEqual(invoice.calculate_total(), booking.total_cost)
         
         # Test case 2: Generate invoice with additional items
-        print("\nTest Case 2: Generate invoice with additional items")
-        booking2 = Booking(self.guest2, self.check_in_date, self.check_out_date)
-        booking2.add_room(self.room2)
-        booking2.create_booking()
+        booking2 = self._make_booking(self.guest2, self.room2, self.check_in_date, self.check_out_date)
         
         payment2 = Payment(booking2, booking2.total_cost, "Debit Card")
         payment2.process_payment()
@@ -180,73 +398,72 @@ class TestHotelSystem(unittest.TestCase):
         invoice2 = payment2.generate_invoice()
         invoice2.add_item("Late checkout fee", 50.0)
         invoice2.add_item("Room service - Dinner", 75.0)
+        self.assertIn("- Late checkout fee: $50.00\n- Room service - Dinner: $75.00", str(invoice2))
+        
+        self.assertAlmostEqual(invoice2.calculate_total(), EXPECTED_DOUBLE_3N_WITH_EXTRAS, places=2)
         
-        print(invoice2)
+        self.assertEqual(invoice2.add_items([("Minibar", 12.5), ("Parking", 20.0)]), 2)
+        self.assertAlmostEqual(invoice2.calculate_total(), EXPECTED_DOUBLE_3N_WITH_ALL_EXTRAS, places=2)
+        self.assertEqual(invoice2.items[-1].description, "Parking")
         
-        expected_total = booking2.total_cost + 50.0 + 75.0
-        self.assertEqual(invoice2.calculate_total(), expected_total)
+        # Test case 3: Generate and send a batch of invoices
+        invoices = [invoice, invoice2]
+        self.assertEqual(generate_pdfs_batch(invoices),
+                         [f"invoice_{invoice.invoice_id}.pdf", f"invoice_{invoice2.invoice_id}.pdf"])
+        self.assertEqual(send_invoices_batch(invoices), [True, True])
     
     def test_payment_processing(self):
         """Test the processing of different payment methods."""
-        print("\n=== Test: Processing Different Payment Methods ===")
-        
         # Test case 1: Process credit card payment
-        print("Test Case 1: Process credit card payment")
-        booking1 = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking1.add_room(self.room1)
-        booking1.create_booking()
-        
-        payment1 = Payment(booking1, booking1.total_cost, "Credit Card",
-                          {"card_number": "XXXX-XXXX-XXXX-5678", "expiry": "10/26"})
-        self.assertTrue(payment1.process_payment())
-        
-        # Test case 2: Process mobile wallet payment with discount
-        print("\nTest Case 2: Process mobile wallet payment with discount")
-        booking2 = Booking(self.guest2, self.check_in_date, self.check_out_date)
-        booking2.add_room(self.room3)
-        booking2.create_booking()
-        
-        payment2 = Payment(booking2, booking2.total_cost, "Mobile Wallet")
-        discount = 50.0  # $50 discount
-        payment2.apply_discount(discount)
-        self.assertTrue(payment2.process_payment())
-        
-        expected_amount = booking2.total_cost - discount
-        self.assertEqual(payment2.amount, expected_amount)
+        # Test case 2: Process mobile wallet payment with a $50 discount
+        cases = [
+            ("Credit Card", self.guest1, self.room1, _CARD_5678, 0.0),
+            ("Mobile Wallet", self.guest2, self.room3, None, 50.0),
+        ]
+        
+        # The payment logger stands in for the gateway, so check what it is handed
+        assert_equal, assert_true = self.assertEqual, self.assertTrue  # bound once for the loop
+        for method, guest, room, details, discount in cases:
+            with self.subTest(method=method):
+                booking = self._confirmed_booking(guest, room, self.check_in_date, self.check_out_date)
+                payment = Payment(booking, booking.total_cost, method, details)
+                if discount:
+                    payment.apply_discount(discount)
+                with patch("payment.logger") as payment_logger:
+                    assert_true(payment.process_payment())
+                
+                assert_true(payment.is_successful)
+                assert_equal(payment.amount, booking.total_cost - discount)
+                assert_equal(payment_logger.info.call_args_list[0].args[1:], (payment.amount, method))
+                assert_equal(payment_logger.info.call_args_list[-1].args[1:], (payment.payment_id,))
     
     def test_reservation_history(self):
         """Test the displaying of reservation history."""
-        print("\n=== Test: Displaying Reservation History ===")
+        guest = Guest(1, "John Smith", "+1-555-123-4567", "john.smith@email.com")
         
         # Test case 1: View history when no reservations exist
-        print("Test Case 1: View history when no reservations exist")
-        reservations1 = self.guest1.view_reservations()
+        reservations1 = guest.view_reservations()
         self.assertEqual(len(reservations1), 0)
         
         # Test case 2: View history after adding reservations
-        print("\nTest Case 2: View history after adding reservations")
-        booking1 = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking1.add_room(self.room1)
-        booking1.create_booking()
-        
-        check_in_date2 = self.today + timedelta(days=20)
-        check_out_date2 = self.today + timedelta(days=25)
-        booking2 = Booking(self.guest1, check_in_date2, check_out_date2)
-        booking2.add_room(self.room2)
-        booking2.create_booking()
-        
-        reservations2 = self.guest1.view_reservations()
-        self.assertEqual(len(reservations2), 2)
+        bookings = [MagicMock(spec=Booking, booking_id=booking_id) for booking_id in ("B1", "B2")]
+        for booking in bookings:
+            self.assertTrue(guest.add_reservation(booking))
+        
+        reservations2 = guest.view_reservations()
+        self.assertEqual(reservations2, bookings)
+        self.assertIs(guest.get_reservation("B2"), bookings[1])
+        self.assertIsNone(guest.get_reservation("missing"))
+        
+        # Test case 3: Creating a booking records it in the guest's history
+        booking3 = self._make_booking(guest, self.room1, self.check_in_date, self.check_out_date)
+        self.assertEqual(len(guest.view_reservations()), 3)
+        self.assertIs(guest.get_reservation(booking3.booking_id), booking3)
     
     def test_cancellation(self):
         """Test the cancellation of reservations."""
-        print("\n=== Test: Cancellation of a Reservation ===")
-        
         # Test case 1: Cancel a confirmed booking
-        print("Test Case 1: Cancel a confirmed booking")
-        booking = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking.add_room(self.room1)
-        booking.create_booking()
+        booking = self._make_booking(self.guest1, self.room1, self.check_in_date, self.check_out_date)
         
         self.assertTrue(booking.is_confirmed)
         self.assertFalse(booking.is_canceled)
@@ -255,46 +472,63 @@ class TestHotelSystem(unittest.TestCase):
         
         self.assertFalse(booking.is_confirmed)
         self.assertTrue(booking.is_canceled)
+        self.assertEqual(booking.rooms, ())
+        self.assertEqual(booking.calculate_total(), 3 * 100.0)
+        self.assertIn("Rooms: 1", str(booking))
         
         # Test case 2: Attempt to cancel an already canceled booking
-        print("\nTest Case 2: Attempt to cancel an already canceled booking")
-        result = booking.cancel_booking()
+        with self.assertLogs("booking", "WARNING") as logs:
+            result = booking.cancel_booking()
         self.assertFalse(result)
+        self.assertIn(f"Booking {booking.booking_id} is already canceled", logs.output[0])
     
     def test_loyalty_program(self):
         """Test the loyalty program functionality."""
-        print("\n=== Test: Loyalty Program ===")
+        # Real guests, so attaching the program is actually recorded
+        guest1 = Guest(1, "John Smith", "+1-555-123-4567", "john.smith@email.com")
+        guest2 = Guest(2, "Jane Doe", "+1-555-987-6543", "jane.doe@email.com")
+        loyalty1 = self._attach_loyalty(guest1, 101)
+        loyalty2 = self._attach_loyalty(guest2, 102)
+        self.assertIs(guest1.get_loyalty_program(), loyalty1)
+        self.assertIs(guest2.get_loyalty_program(), loyalty2)
         
         # Test case 1: Earn points from a stay
-        print("Test Case 1: Earn points from a stay")
-        initial_points = self.loyalty1.points
+        initial_points = loyalty1.points
         stay_value = 500.0
-        earned_points = self.loyalty1.earn_points(stay_value)
+        earned_points = loyalty1.earn_points(stay_value)
         
         self.assertEqual(earned_points, 500)
-        self.assertEqual(self.loyalty1.points, initial_points + 500)
+        self.assertEqual(loyalty1.points, initial_points + 500)
         
         # Test case 2: Redeem points for a discount
-        print("\nTest Case 2: Redeem points for a discount")
-        self.loyalty2.earn_points(2000.0)  # Earn 2000 points
-        initial_points = self.loyalty2.points
+        loyalty2.earn_points(2000.0)  # Earn 2000 points
+        initial_points = loyalty2.points
         points_to_redeem = 1000
         
-        redemption_value = self.loyalty2.redeem_points(points_to_redeem)
+        redemption_value = loyalty2.redeem_points(points_to_redeem)
         self.assertEqual(redemption_value, 100.0)  # 1000 points = $100
-        self.assertEqual(self.loyalty2.points, initial_points - points_to_redeem)
+        self.assertEqual(loyalty2.points, initial_points - points_to_redeem)
+        self.assertEqual(loyalty2.tier, "Silver")
+        
+        # Test case 3: Tier follows the point balance across thresholds
+        loyalty1.earn_points(4500.0)  # 5000 points in total
+        self.assertEqual(loyalty1.tier, "Gold")
+        loyalty1.redeem_points(1)
+        self.assertEqual(loyalty1.tier, "Silver")
+        
+        # Test case 4: A negative balance keeps the current tier
+        loyalty3 = LoyaltyProgram(103, None)
+        loyalty3.earn_points(-50.0)
+        self.assertEqual(loyalty3.points, -50)
+        self.assertEqual(loyalty3.tier, "Bronze")
 
     def test_guest_services(self):
         """Test guest service requests."""
-        print("\n=== Test: Guest Service Requests ===")
-        
         # Test case 1: Create a housekeeping request
-        print("Test Case 1: Create a housekeeping request")
         service1 = GuestService(self.guest1, 101, ServiceType.HOUSEKEEPING, "Need extra towels")
         self.assertTrue(service1.request_service())
         
         # Test case 2: Track service status
-        print("\nTest Case 2: Track service status and assign staff")
         service1.assign_staff("Maria Garcia")
         self.assertEqual(service1.status.value, "Assigned")
         self.assertEqual(service1.assigned_staff, "Maria Garcia")
@@ -302,24 +536,38 @@ class TestHotelSystem(unittest.TestCase):
         
         service1.complete_service()
         self.assertEqual(service1.status.value, "Completed")
+        
+        # Test case 3: Complete a batch of requests under one timestamp
+        services = [GuestService(self.guest2, 201, ServiceType.LAUNDRY, "Press two shirts") for _ in range(3)]
+        with frozen_time() as completed_at:
+            for service in services:
+                service.complete_service()
+        
+        self.assertTrue(all(service.completion_time == completed_at for service in services))
 
     def test_feedback_submission(self):
         """Test feedback submission."""
-        print("\n=== Test: Feedback Submission ===")
-        
         # Create a booking for feedback
-        booking = Booking(self.guest1, self.check_in_date, self.check_out_date)
-        booking.add_room(self.room1)
-        booking.create_booking()
-        
-        # Test case 1: Submit basic feedback
-        print("Test Case 1: Submit basic feedback")
-        feedback1 = Feedback(self.guest1, booking, 4, "Great stay, very comfortable room!")
-        self.assertTrue(feedback1.submit_review())
+        booking = self._confirmed_booking(self.guest1, self.room1, self.check_in_date, self.check_out_date)
+        
+        # Test case 1: Submit basic feedback from each guest against the same booking
+        cases = [
+            (self.guest1, 4, "Great stay, very comfortable room!"),
+            (self.guest2, 3, "Good location but room could be cleaner."),
+        ]
+        
+        feedbacks = []
+        assert_equal, assert_true = self.assertEqual, self.assertTrue  # bound once for the loop
+        for guest, rating, comment in cases:
+            with self.subTest(guest=guest.name):
+                feedback = Feedback(guest, booking, rating, comment)
+                assert_true(feedback.submit_review())
+                assert_equal(feedback.rating, rating)
+                assert_equal(feedback.submission_date, FROZEN_NOW)
+                feedbacks.append(feedback)
         
         # Test case 2: Submit detailed category ratings
-        print("\nTest Case 2: Submit detailed category ratings")
-        feedback2 = Feedback(self.guest2, booking, 3, "Good location but room could be cleaner.")
+        feedback2 = feedbacks[1]
         feedback2.rate_experience(cleanliness=3, comfort=4, staff=5, value=4, location=5)
         
         self.assertEqual(feedback2.rating, 4)  # Average of all category ratings